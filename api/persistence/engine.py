@@ -75,14 +75,14 @@ class Persistence(persistence.base.Persistence, Loggable):
             # Don't refresh groups that are known to the session
             return
 
-        log.debug(f"Persisting group {gid}")
+        log.debug("Persisting group %s", gid)
         t.execute("""
             insert into groups (gid) values (%s)
             on conflict do nothing;
         """, (gid,))
 
         for user in group.owners:
-            log.debug(f"Recording user {user.uid} as an owner of group {gid}")
+            log.debug("Recording user %s as an owner of group %s", user.uid, gid)
             t.execute("""
                 insert into group_owners (gid, owner) values (%s, %s)
                 on conflict do nothing;
@@ -97,8 +97,7 @@ class Persistence(persistence.base.Persistence, Loggable):
         @param   file   File model to persist
         @param   state  State in which to set the state
         """
-        log     = self.log
-        file_id = f"{file.device}:{file.inode}"
+        log = self.log
 
         # If a persisted file's status (mtime, size, etc.) has changed
         # in the meantime, we need to delete that record and start over;
@@ -111,21 +110,21 @@ class Persistence(persistence.base.Persistence, Loggable):
             known = File.FromDBQuery(t, file, self._idm)
             if known is not None and file != known:
                 # Delete known file if it differs
-                log.debug(f"Deleting records for file {file_id}")
+                log.debug("Deleting records for file %s:%s", file.device, file.inode)
                 known = known.purge(t)
 
             if known is None or known.key != file.key:
                 # Insert/update the file record, if necessary
-                message = f"Persisting file {file_id}" if known is None \
-                          else f"Updating persisted key for {file_id}"
+                message = "Persisting file %s:%s" if known is None \
+                          else "Updating persisted key for %s:%s"
 
-                log.debug(message)
+                log.debug(message, file.device, file.inode)
                 known = file.persist(t)
 
-            if state.exists(t, known) is None:
+            if not state.exists(t, [known]):
                 # Set state, if not already
-                log.debug(f"Setting {state.db_type} status for file {file_id}")
-                state.persist(t, known)
+                log.debug("Setting %s status for file %s:%s", state.db_type, file.device, file.inode)
+                state.persist(t, [known])
 
     @property
     def stakeholders(self) -> T.Iterator[idm.base.User]:
@@ -163,7 +162,7 @@ class Persistence(persistence.base.Persistence, Loggable):
             """, params)
 
             for record in t:
-                self.log.debug(f"Adding {record.device}:{record.inode} to collection")
+                self.log.debug("Adding %s:%s to collection", record.device, record.inode)
                 collection += File.FromDBRecord(record, self._idm)
 
         return collection
@@ -182,8 +181,7 @@ class Persistence(persistence.base.Persistence, Loggable):
         stakeholder = files.criteria.stakeholder
 
         with self._pg.transaction() as t:
-            for file in files:
-                state.mark_notified(t, file, stakeholder)
+            state.mark_notified(t, files, stakeholder)
 
     @clean.register
     def _(self, files:FileCollection.StagedQueue) -> None:
@@ -28,85 +28,95 @@ from .file import File
 _Anything = persistence.Anything
 _MaybeStakeholder = T.Union[idm.base.User, T.Type[_Anything]]
 _SQLSnippet = T.Tuple[str, T.Tuple]
+_StatusIDs = T.Dict[int, int]
+
+
+def _or_null(value:T.Any) -> T.Any:
+    """ Map the "anything" filter to SQL NULL """
+    return None if value == _Anything else value
 
 
 class _PersistedState(persistence.base.State):
     """ Base for our persistence operations """
     db_type:T.ClassVar[str]
 
-    def exists(self, t:Transaction, file:File) -> T.Optional[int]:
+    def exists(self, t:Transaction, files:T.Collection[File]) -> _StatusIDs:
         """
-        Check the status exists for a given file
+        Check the status exists for the given files
 
-        @param   t     Transaction
-        @param   file  File
-        @return  The status ID, if available, or None otherwise
+        @param   t      Transaction
+        @param   files  Files
+        @return  Mapping of file IDs to their status IDs, where available
         """
-        assert hasattr(file, "db_id")
+        assert all(hasattr(file, "db_id") for file in files)
 
-        t.execute("""
-            select id
+        t.execute_prepared("status_exists", """
+            select id,
+                   file
             from   status
-            where  state = %s
-            and    file  = %s;
-        """, (self.db_type, file.db_id))
+            where  state = $1
+            and    file  = any($2);
+        """, (self.db_type, [file.db_id for file in files]))
 
-        if (record := t.fetchone()) is None:
-            return None
-        return record.id
+        return {record.file: record.id for record in t}
 
-    def persist(self, t:Transaction, file:File) -> int:
+    def persist(self, t:Transaction, files:T.Collection[File]) -> _StatusIDs:
         """
-        Persist the status for a given file
+        Persist the status for the given files
 
-        @param   t     Transaction
-        @param   file  File
-        @return  New status ID
+        @param   t      Transaction
+        @param   files  Files
+        @return  Mapping of file IDs to their new status IDs
         """
-        assert hasattr(file, "db_id")
+        assert all(hasattr(file, "db_id") for file in files)
 
-        t.execute("""
+        t.execute_prepared("status_persist", """
             insert into status (file, state)
-            values (%s, %s)
-            returning id;
-        """, (file.db_id, self.db_type))
-        state_id = t.fetchone().id
+            select unnest($2::integer[]), $1::state
+            returning id, file;
+        """, (self.db_type, [file.db_id for file in files]))
+        state_ids = {record.file: record.id for record in t}
 
         # Set the notification status for all stakeholders, if required
         # (this should never happen in production)
         if self.notified:
-            self.mark_notified(t, file, _Anything)
+            self.mark_notified(t, files, _Anything)
 
-        return state_id
+        return state_ids
 
-    def mark_notified(self, t:Transaction, file:File, stakeholder:_MaybeStakeholder) -> None:
+    def mark_notified(self, t:Transaction, files:T.Collection[File], stakeholder:_MaybeStakeholder) -> None:
         """
-        Set the notification state to true for a file and stakeholder
+        Set the notification state to true for the given files and
+        stakeholder
 
         @param   t            Transaction
-        @param   file         File
+        @param   files        Files
         @param   stakeholder  Stakeholder
         """
-        if (state_id := self.exists(t, file)) is None:
-            state_id = self.persist(t, file)
-
-        query_params = (state_id, file.db_id)
+        # NOTE Files are handled in bulk so that the number of database
+        # round-trips is independent of the number of files
+        state_ids = self.exists(t, files)
+        if unpersisted := [file for file in files if file.db_id not in state_ids]:
+            state_ids.update(self.persist(t, unpersisted))
+
+        query_name = "status_notify"
+        query_params = (list(state_ids.values()),)
         query_sql = """
             select id,
                    stakeholder
             from   stakeholder_notified
             where  (not notified)
-            and    id   = %s
-            and    file = %s
+            and    id = any($1)
         """
 
         if stakeholder != _Anything:
+            query_name += "_stakeholder"
             query_params += (stakeholder.uid,)
             query_sql += """
-                and stakeholder = %s
+                and stakeholder = $2
             """
 
-        t.execute(f"""
+        t.execute_prepared(query_name, f"""
             insert into notifications (status, stakeholder)
             {query_sql}
             on conflict do nothing;
@@ -124,26 +134,18 @@ class _PersistedState(persistence.base.State):
         # snippets to the persistence engine, we could return the actual
         # files. However, that would need a reference to the persistence
         # engine (and the IdM), so this is "the least bad" compromise!
-        params = (self.db_type,)
-        sql = """
+        # NOTE Optional filters are NULL when unconstrained, so the SQL
+        # is the same whichever filters are supplied
+        notified = _or_null(self.notified)
+        uid = None if stakeholder == _Anything else stakeholder.uid
+
+        return """
             select distinct file
             from   stakeholder_notified
             where  state = %s
-        """
-
-        if self.notified != _Anything:
-            params += (self.notified,)
-            sql += """
-                and notified = %s
-            """
-
-        if stakeholder != _Anything:
-            params += (stakeholder.uid,)
-            sql += """
-                and stakeholder = %s
-            """
-
-        return sql, params
+            and    (%s is null or notified = %s)
+            and    (%s is null or stakeholder = %s)
+        """, (self.db_type, notified, notified, uid, uid)
 
 
 class State(T.SimpleNamespace):
@@ -162,66 +164,74 @@ class State(T.SimpleNamespace):
         db_type = "warned"
         tminus:T.Union[T.TimeDelta, T.Type[_Anything]]
 
-        def exists(self, t:Transaction, file:File) -> T.Optional[int]:
+        def exists(self, t:Transaction, files:T.Collection[File]) -> _StatusIDs:
             # Warnings are special, so we override the superclass
-            assert hasattr(file, "db_id")
+            assert all(hasattr(file, "db_id") for file in files)
             assert self.tminus != _Anything
 
-            t.execute("""
-                select status.id
+            t.execute_prepared("warned_exists", """
+                select status.id,
+                       status.file
                 from   warnings
                 join   status
                 on     status.id       = warnings.status
-                where  status.file     = %s
-                and    warnings.tminus = %s;
-            """, (file.db_id, self.tminus))
+                where  status.file     = any($1)
+                and    warnings.tminus = $2;
+            """, ([file.db_id for file in files], self.tminus))
 
-            if (record := t.fetchone()) is None:
-                return None
-            return record.id
+            return {record.file: record.id for record in t}
 
-        def persist(self, t:Transaction, file:File) -> int:
-            # Warnings are special, so we extend the superclass
-            assert hasattr(file, "db_id")
+        def persist(self, t:Transaction, files:T.Collection[File]) -> _StatusIDs:
+            # Warnings are special, so we override the superclass
+            # NOTE The warnings records must exist before any
+            # notification state is set, so we can't defer to super
+            assert all(hasattr(file, "db_id") for file in files)
             assert self.tminus != _Anything
 
-            state_id = super().persist(t, file)
-            t.execute("""
-                insert into warnings (status, tminus)
-                values (%s, %s);
-            """, (state_id, self.tminus))
-
-            return state_id
+            t.execute_prepared("warned_persist", """
+                with data (file, tminus) as (
+                    select unnest($1::integer[]), $2::interval
+                ),
+                inserted as (
+                    insert into status (file, state)
+                    select file, 'warned'::state
+                    from   data
+                    returning id, file
+                ),
+                warned as (
+                    insert into warnings (status, tminus)
+                    select inserted.id,
+                           data.tminus
+                    from   inserted
+                    join   data
+                    on     data.file = inserted.file
+                )
+                select id,
+                       file
+                from   inserted;
+            """, ([file.db_id for file in files], self.tminus))
+            state_ids = {record.file: record.id for record in t}
+
+            if self.notified:
+                self.mark_notified(t, files, _Anything)
+
+            return state_ids
 
         def file_cte(self, stakeholder:_MaybeStakeholder) -> _SQLSnippet:
             # Warnings are special, so we override the superclass
             # TODO There's scope for abstraction here: the query is the
             # same, with an additional join and possible parameter
-            params = (self.db_type,)
-            sql = """
+            notified = _or_null(self.notified)
+            uid = None if stakeholder == _Anything else stakeholder.uid
+            tminus = _or_null(self.tminus)
+
+            return """
                 select distinct stakeholder_notified.file
                 from   stakeholder_notified
                 join   warnings
                 on     warnings.status = stakeholder_notified.id
                 where  stakeholder_notified.state = %s
-            """
-
-            if self.notified != _Anything:
-                params += (self.notified,)
-                sql += """
-                    and stakeholder_notified.notified = %s
-                """
-
-            if stakeholder != _Anything:
-                params += (stakeholder.uid,)
-                sql += """
-                    and stakeholder_notified.stakeholder = %s
-                """
-
-            if self.tminus != _Anything:
-                params += (self.tminus,)
-                sql += """
-                    and warnings.tminus = %s
-                """
-
-            return sql, params
+                and    (%s is null or stakeholder_notified.notified = %s)
+                and    (%s is null or stakeholder_notified.stakeholder = %s)
+                and    (%s is null or warnings.tminus = %s)
+            """, (self.db_type, notified, notified, uid, uid, tminus, tminus)
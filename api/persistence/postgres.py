@@ -21,6 +21,7 @@ import os
 from abc import ABCMeta, abstractmethod
 from contextlib import AbstractContextManager
 from functools import singledispatch
+from weakref import WeakKeyDictionary
 
 from psycopg2 import Error as PGError
 from psycopg2.errors import RaiseException
@@ -36,6 +37,10 @@ _POOL_MIN = int(os.getenv("PG_POOL_MIN", "1"))
 _POOL_MAX = int(os.getenv("PG_POOL_MAX", "10"))
 
 
+# Server-side prepared statement names, by connection
+_prepared:T.MutableMapping[BaseConnection, T.Set[str]] = WeakKeyDictionary()
+
+
 _ExcT = T.TypeVar("_ExcT", bound=persistence.exception.BackendException)
 
 def _exception(heading:str, pg_exc:PGError, exc_type:T.Type[_ExcT]) -> _ExcT:
@@ -55,6 +60,29 @@ def _(exc:RaiseException) -> persistence.exception.LogicException:
     # RaiseException -> LogicException
     return _exception("PL/pgSQL exception", exc, persistence.exception.LogicException)
 
+class _PreparingCursor(NamedTupleCursor):
+    """ Named tuple cursor with support for prepared statements """
+    def execute_prepared(self, name:str, sql:str, params:T.Tuple) -> None:
+        """
+        Execute a named, server-side prepared statement, preparing it
+        first if it is not yet known to the cursor's connection
+
+        NOTE Prepared statements persist for the lifetime of the
+        connection and are unaffected by transaction rollbacks, so the
+        SQL for any given name must be constant
+
+        @param  name    Statement name
+        @param  sql     SQL statement, with positional ($n) parameters
+        @param  params  Statement parameters
+        """
+        prepared = _prepared.setdefault(self.connection, set())
+        if name not in prepared:
+            self.execute(f"prepare {name} as {sql}")
+            prepared.add(name)
+
+        placeholders = ", ".join(["%s"] * len(params))
+        self.execute(f"execute {name} ({placeholders});", params)
+
 class _BaseSession(AbstractContextManager, metaclass=ABCMeta):
     """ Abstract base class for session context managers """
     _connection:BaseConnection
@@ -120,7 +148,7 @@ class PostgreSQL:
 
     def __init__(self, *, database:str, user:str, password:str, host:str, port:int = 5432) -> None:
         dsn = f"dbname={database} user={user} password={password} host={host} port={port}"
-        self._pool = ThreadedConnectionPool(_POOL_MIN, _POOL_MAX, dsn, cursor_factory=NamedTupleCursor)
+        self._pool = ThreadedConnectionPool(_POOL_MIN, _POOL_MAX, dsn, cursor_factory=_PreparingCursor)
 
     def __del__(self) -> None:
         self._pool.closeall()
@@ -70,13 +70,13 @@ class VaultFile(core.vault.base.VaultFile):
 
                 if check != branch:
                     # Branch differs from expectation
-                    log.info(f"{path} was found in the {check} branch, rather than {branch}")
+                    log.info("%s was found in the %s branch, rather than %s", path, check, branch)
                     self.branch = check
 
                 if alternate_key.source != path:
                     # Path differs from expectation
                     # (i.e., source was moved or renamed)
-                    log.info(f"{path} was found in the vault as {alternate_key.source}")
+                    log.info("%s was found in the vault as %s", path, alternate_key.source)
 
         # If a key already exists in the vault, then it must have:
         # * At least two hardlinks, when in the Keep or Archive branch
@@ -117,6 +117,13 @@ class Vault(BaseHGIVault):
 
         return (user.uid for user in group.owners)
 
+    def branch(self, path:T.Path) -> T.Optional[Branch]:
+        # NOTE VaultFile searches every branch for the file's key and
+        # corrects its branch to wherever it's found, so a single lookup
+        # suffices (rather than one per branch, as in the base class)
+        vault_file = self.file(Branch.Keep, path)
+        return vault_file.branch if vault_file.exists else None
+
     def add(self, branch:Branch, path:T.Path) -> VaultFile:
         log = self.log
 
@@ -100,7 +100,7 @@ class Sweeper(Loggable):
 
         # Create and send the e-mail for each stakeholder
         for stakeholder in self._persistence.stakeholders:
-            log.debug(f"Creating e-mail for UID {stakeholder.uid}")
+            log.debug("Creating e-mail for UID %s", stakeholder.uid)
 
             with ExitStack() as stack:
                 # For convenience
@@ -142,7 +142,7 @@ class Sweeper(Loggable):
                                             [file.path for file in files])
                 if non_trivial:
                     postman.send(mail, stakeholder)
-                    log.info(f"Sent summary e-mail to {stakeholder.name} ({stakeholder.email})")
+                    log.info("Sent summary e-mail to %s (%s)", stakeholder.name, stakeholder.email)
 
                 else:
                     log.debug("Skipping: Trivial e-mail")
@@ -179,7 +179,7 @@ class Sweeper(Loggable):
         special directories
         """
         log = self.log
-        log.debug(f"{file.path} is physically contained within the vault in {vault.root}")
+        log.debug("%s is physically contained within the vault in %s", file.path, vault.root)
 
         # We only need to check for corruptions (i.e., single hardlink)
         # of files that physically exist in the keep or archive branches
@@ -194,25 +194,25 @@ class Sweeper(Loggable):
 
             if branch == Branch.Limbo:
                 if hardlinks(file.path) > 1:
-                    log.warning(f"Corruption detected: Physical vault file {file.path} in limbo has more than one hardlink")
+                    log.warning("Corruption detected: Physical vault file %s in limbo has more than one hardlink", file.path)
 
                 if _can_permanently_delete(file):
-                    log.info(f"Permanently Deleting: {file.path} has passed the hard-deletion threshold")
+                    log.info("Permanently Deleting: %s has passed the hard-deletion threshold", file.path)
                     if self.Yes_I_Really_Mean_It_This_Time:
                         try:
                             file.delete()  # DELETION WARNING
                         except PermissionError:
-                            log.error(f"Could not delete {file.path}: Permission denied")
+                            log.error("Could not delete %s: Permission denied", file.path)
 
             else:
                 if hardlinks(file.path) == 1:
-                    log.warning(f"Corruption detected: Physical vault file {file.path} does not link to any source")
+                    log.warning("Corruption detected: Physical vault file %s does not link to any source", file.path)
                     if self.Yes_I_Really_Mean_It_This_Time:
                         try:
                             file.delete()  # DELETION WARNING
-                            log.info(f"Corruption corrected: {file.path} deleted")
+                            log.info("Corruption corrected: %s deleted", file.path)
                         except PermissionError:
-                            log.error(f"Could not delete {file.path}: Permission denied")
+                            log.error("Could not delete %s: Permission denied", file.path)
 
     ####################################################################
 
@@ -232,7 +232,7 @@ class Sweeper(Loggable):
         (above). As such, as we cannot distinguish amongst these cases,
         all we can realistically do is log it here and move on.
         """
-        self.log.error(f"Corruption detected: {status}")
+        self.log.error("Corruption detected: %s", status)
 
     ####################################################################
 
@@ -246,14 +246,14 @@ class Sweeper(Loggable):
         staging, the original source file is hard-deleted
         """
         log = self.log
-        log.debug(f"{file.path} is in the {status} branch of the vault in {vault.root}")
+        log.debug("%s is in the %s branch of the vault in %s", file.path, status, vault.root)
 
         if status in [Branch.Stash, Branch.Archive]:
             if file.locked:
-                log.info(f"Skipping: {file.path} is marked for archival, but is locked by another process")
+                log.info("Skipping: %s is marked for archival, but is locked by another process", file.path)
                 return
 
-            log.info(f"Staging {file.path} for archival")
+            log.info("Staging %s for archival", file.path)
 
             if self.Yes_I_Really_Mean_It_This_Time:
                 # 1. Move the file to the staging branch
@@ -263,7 +263,7 @@ class Sweeper(Loggable):
                 to_persist = file.to_persistence(key=staged.path)
                 self._persistence.persist(to_persist, State.Staged(notified=False))
                 
-                log.info(f"{file.path} has been staged for archival")
+                log.info("%s has been staged for archival", file.path)
 
             if status == Branch.Archive:
                 # 3. Delete source
@@ -271,7 +271,7 @@ class Sweeper(Loggable):
                 try:
                     file.delete()  # DELETION WARNING
                 except PermissionError:
-                    log.error(f"Could not hard-delete {file.path}: Permission denied")
+                    log.error("Could not hard-delete %s: Permission denied", file.path)
 
     ####################################################################
 
@@ -285,7 +285,7 @@ class Sweeper(Loggable):
         their ages exceed warning thresholds
         """
         log = self.log
-        log.debug(f"{file.path} is untracked")
+        log.debug("%s is untracked", file.path)
 
         try:
             if not VaultFile(vault, Branch.Limbo, file.path).can_add:
@@ -299,10 +299,10 @@ class Sweeper(Loggable):
 
         if _can_soft_delete(file):
             if file.locked:
-                log.info(f"Skipping: {file.path} has passed the soft-deletion threshold, but is locked by another process")
+                log.info("Skipping: %s has passed the soft-deletion threshold, but is locked by another process", file.path)
                 return
 
-            log.info(f"Deleting: {file.path} has passed the soft-deletion threshold")
+            log.info("Deleting: %s has passed the soft-deletion threshold", file.path)
             if self.Yes_I_Really_Mean_It_This_Time:
                 # 0. Instantiate the persisted file model before it's
                 #    deleted so we don't lose its stat information
@@ -314,13 +314,13 @@ class Sweeper(Loggable):
                 assert hardlinks(file.path) > 1
                 try:
                     file.delete()  # DELETION WARNING
-                    log.info(f"Soft-deleted {file.path}")
+                    log.info("Soft-deleted %s", file.path)
 
                 except PermissionError:
-                    log.error(f"Could not soft-delete {file.path}: Permission denied")
+                    log.error("Could not soft-delete %s: Permission denied", file.path)
                     return
 
-                log.info(f"{file.path} has been soft-deleted")
+                log.info("%s has been soft-deleted", file.path)
 
                 # 2. Persist to database
                 self._persistence.persist(to_persist, State.Deleted(notified=False))
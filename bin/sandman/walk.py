@@ -21,10 +21,10 @@ from __future__ import annotations
 
 import os
 import fcntl
-import gzip
 import stat
 from abc import ABCMeta, abstractmethod
-from os.path import commonprefix
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from api.logging import Loggable
 from api.persistence import models
@@ -34,10 +34,23 @@ from core import file, time, typing as T
 from core.utils import base64
 from core.vault import exception as VaultExc
 
+try:
+    # Intel's ISA-L gzip implementation decompresses several times
+    # faster than zlib, which matters for multi-gigabyte mpistat files
+    from isal import igzip as gzip
+except ImportError:
+    import gzip
+
 
 # Automatic re-stat period (default: 36 hours)
 _RESTAT_AFTER = time.delta(hours=int(os.getenv("RESTAT_AFTER", "36")))
 
+# Filesystem walker threads (default: 4 per CPU, up to 32; at least 1)
+_WALKERS = max(1, int(os.getenv("WALKERS", str(min(32, 4 * (os.cpu_count() or 1))))))
+
+# Directory scans that may run ahead of the walk
+_SCANS_AHEAD = 2 * _WALKERS
+
 
 # Downstream only cares about physical and corrupted vault files
 # i.e., We use our vault exceptions as sentinel types
@@ -54,10 +67,11 @@ class File(file.BaseFile):
     """ Walked file model (wrapper around persistence file model) """
     _file:models.File
     _timestamp:T.DateTime
+    _last_active:T.DateTime
 
     def __init__(self, file:models.File, timestamp:T.Optional[T.DateTime] = None) -> None:
         """ Construct from filesystem """
-        self._file = file
+        self._set_file(file)
         self._timestamp = timestamp or time.now()
 
     @classmethod
@@ -91,7 +105,7 @@ class File(file.BaseFile):
     @property
     def age(self) -> T.TimeDelta:
         self.restat()
-        return time.now() - max([self._file.mtime, self._file.atime, self._file.ctime])
+        return time.now() - self._last_active
 
     @property
     def locked(self) -> bool:
@@ -113,12 +127,21 @@ class File(file.BaseFile):
         """ Forcibly restat the file if it's stale """
         # NOTE We backup and restore the key value because it's set to
         # None in the constructor with no way to override it
-        if force or time.now() - self._timestamp > _RESTAT_AFTER:
+        now = time.now()
+        if force or now - self._timestamp > _RESTAT_AFTER:
             key = self._file.key
-            self._file = models.File.FromFS(self.path, idm)
+            self._set_file(models.File.FromFS(self.path, idm))
             self._file.key = key
 
-            self._timestamp = time.now()
+            self._timestamp = now
+
+    def _set_file(self, file:models.File) -> None:
+        """ Set the persistence file model and its time of last activity """
+        # NOTE The age of a file is checked several times per sweep (at
+        # least once per hot code implementation), so we only find the
+        # latest of its timestamps when its stat information changes
+        self._file = file
+        self._last_active = max(file.mtime, file.atime, file.ctime)
 
     def delete(self) -> None:
         """ Delete the file """
@@ -217,24 +240,104 @@ class FilesystemWalker(BaseWalker):
         self._vaults = self._fetch_vaults(*bases)
 
     @staticmethod
-    def _walk_tree(path:T.Path, vault:Vault) -> T.Iterator[T.Tuple[Vault, File, _VaultStatusT]]:
-        # Recursively walk the tree from the given path
-        for f in path.iterdir():
-            # NOTE Don't walk symlinked directories: if they're symlinks
-            # within the same root, we'll get to them eventually; if
-            # they're outside the root, things could go very wrong!
-            if (not f.is_symlink()) and f.is_dir() and os.access(f, os.X_OK):
-                yield from FilesystemWalker._walk_tree(f, vault)
-
-            # We only care about regular files
-            elif file.is_regular(f):
-                yield vault, \
-                      File.FromFS(f), \
-                      FilesystemWalker._vault_status(vault, f)
+    def _scan(path:T.Path) -> T.Tuple[T.List[T.Path], T.List[T.Path]]:
+        """
+        Scan a directory for its subdirectories to walk and the regular
+        files it contains
+
+        @param   path  Directory
+        @return  Subdirectories and regular files
+        """
+        # NOTE os.scandir's entries know their type, so we can classify
+        # them without a stat call per entry. Files are not stat'ed
+        # here, as scans run ahead of the sweep; see files()
+        subdirs, files = [], []
+
+        # NOTE This runs for every directory entry, so the functions it
+        # calls are bound to locals to avoid repeated attribute lookups
+        Path, access = T.Path, os.access
+        add_subdir, add_file = subdirs.append, files.append
+
+        with os.scandir(path) as listing:
+            for entry in listing:
+                f = Path(entry.path)
+
+                # NOTE Don't walk symlinked directories: if they're
+                # symlinks within the same root, we'll get to them
+                # eventually; if they're outside the root, things
+                # could go very wrong!
+                if entry.is_dir(follow_symlinks=False) and access(f, os.X_OK):
+                    add_subdir(f)
+
+                # We only care about regular files
+                elif entry.is_file(follow_symlinks=False):
+                    add_file(f)
+
+        return subdirs, files
 
     def files(self) -> T.Iterator[T.Tuple[Vault, File, _VaultStatusT]]:
-        for vault in self._vaults:
-            yield from FilesystemWalker._walk_tree(vault.root, vault)
+        # NOTE Directory scans are dominated by filesystem latency, so
+        # they are run concurrently in a thread pool. Scanned files are
+        # stat'ed, and their vault status determined, in the calling
+        # thread just before they're yielded, so they are as fresh as
+        # in a sequential walk, however far ahead the scans have run.
+        # NOTE Unscanned directories are kept on a stack and at most
+        # _SCANS_AHEAD scans are in flight, consumed in the order they
+        # were submitted; this bounds memory to roughly what a depth-
+        # first walk needs, rather than a whole level of the tree
+        scan_dir, from_stat, vault_status = FilesystemWalker._scan, File.FromStat, FilesystemWalker._vault_status
+        lstat, is_regular, now = os.lstat, stat.S_ISREG, time.now
+
+        unscanned = [(vault.root, vault) for vault in self._vaults]
+        scans = deque()
+
+        with ThreadPoolExecutor(max_workers=_WALKERS) as pool:
+            try:
+                while unscanned or scans:
+                    while unscanned and len(scans) < _SCANS_AHEAD:
+                        path, vault = unscanned.pop()
+                        scans.append((pool.submit(scan_dir, path), vault))
+
+                    scan, vault = scans.popleft()
+                    subdirs, files = scan.result()
+                    unscanned.extend((subdir, vault) for subdir in subdirs)
+
+                    for f in files:
+                        try:
+                            file_stat = lstat(f)
+
+                        except FileNotFoundError:
+                            # The file was removed since it was scanned
+                            continue
+
+                        if is_regular(file_stat.st_mode):
+                            yield vault, \
+                                  from_stat(f, file_stat, now()), \
+                                  vault_status(vault, f)
+
+            finally:
+                # Don't wait on outstanding scans if we finish early
+                for scan, _ in scans:
+                    scan.cancel()
+
+
+def _read_lines(stream:T.BinaryIO, chunk_size:int = 1 << 20) -> T.Iterator[bytes]:
+    """
+    Generate the lines of a binary stream, without line endings, by
+    reading it in large chunks rather than line-by-line
+
+    @param   stream      Binary stream
+    @param   chunk_size  Read size (default: 1MiB)
+    @return  Generator of lines
+    """
+    # Carry the partial line at the end of each chunk into the next
+    carry = b""
+    while chunk := stream.read(chunk_size):
+        *lines, carry = (carry + chunk).split(b"\n")
+        yield from lines
+
+    if carry:
+        yield carry
 
 
 # mpistat field indices
@@ -254,7 +357,8 @@ class mpistatWalker(BaseWalker):
     _mpistat:T.Path
     _timestamp:T.DateTime
 
-    _vaults:T.Dict[str, Vault]
+    _vaults:T.Dict[T.Path, Vault]
+    _prefixes:T.Tuple[bytes, ...]
 
     def __init__(self, mpistat:T.Path, *bases:T.Path) -> None:
         """
@@ -274,42 +378,42 @@ class mpistatWalker(BaseWalker):
 
         # Log a warning if forcible restat'ing is going to happen
         if time.now() - self._timestamp > _RESTAT_AFTER:
-            self.log.warning(f"mpistat file is out of date; files will be forcibly restat'ed")
+            self.log.warning("mpistat file is out of date; files will be forcibly restat'ed")
 
-        self._vaults = {
-            mpistatWalker._base64_prefix(vault.root): vault
-            for vault in self._fetch_vaults(*bases)
-        }
+        self._vaults = {vault.root: vault for vault in self._fetch_vaults(*bases)}
+        self._prefixes = tuple(mpistatWalker._base64_prefix(root) for root in self._vaults)
 
     @staticmethod
-    def _base64_prefix(path:T.Path) -> str:
-        # Find the common base64 prefix of a path to optimise searching
-        bare    = base64.encode(path)
-        slashed = base64.encode(f"{path}/")
+    def _base64_prefix(path:T.Path) -> bytes:
+        # Find the base64 prefix common to everything under a path to
+        # optimise searching. Each complete three byte group of the
+        # slashed path encodes to four fixed characters and, of any
+        # remaining n bytes, the first n characters don't depend on
+        # what follows; the longer the prefix, the fewer false positive
+        # matches that need to be decoded
+        slashed = f"{path}/".encode()
+        groups, remainder = divmod(len(slashed), 3)
+
+        return base64.encode(slashed)[:4 * groups + remainder].encode()
+
+    def _is_match(self, encoded_path:bytes) -> T.Optional[T.Tuple[Vault, T.Path]]:
+        """ Check that an encoded path is in one of our vaults """
+        # Only base64 decode if there's a potential match
+        if not encoded_path.startswith(self._prefixes):
+            return None
 
-        return commonprefix([bare, slashed])
+        decoded_path = T.Path(base64.decode(encoded_path).decode())
 
-    def _is_match(self, encoded_path:str) -> T.Optional[T.Tuple[Vault, T.Path]]:
-        """ Check that an encoded path is in one of our vaults """
-        for prefix, vault in self._vaults.items():
-            if encoded_path.startswith(prefix):
-                # Only base64 decode if there's a potential match
-                decoded_path = T.Path(base64.decode(encoded_path).decode())
-
-                # Check if we have an actual match
-                try:
-                    _ = decoded_path.relative_to(vault.root)
-                    return vault, decoded_path
-                except ValueError:
-                    # If decoded_path is not a child of the vault
-                    # root, then rinse and repeat...
-                    continue
+        # Check if we have an actual match by looking up the decoded
+        # path's ancestors, rather than checking each vault in turn
+        for parent in decoded_path.parents:
+            if (vault := self._vaults.get(parent)) is not None:
+                return vault, decoded_path
 
-        # ...until no match
         return None
 
     @staticmethod
-    def _make_stat(*stats:str) -> os.stat_result:
+    def _make_stat(*stats:bytes) -> os.stat_result:
         """ Convert an mpistat record into an os.stat_result """
         # WARNING os.stat_result does not have a documented interface
         assert len(stats) == 10
@@ -327,17 +431,27 @@ class mpistatWalker(BaseWalker):
         ))
 
     def files(self) -> T.Iterator[T.Tuple[Vault, File, _VaultStatusT]]:
-        with gzip.open(self._mpistat, mode="rt") as mpistat:
-            # Strip excess whitespace and split each line by tabs
-            while fields := mpistat.readline().strip().split("\t"):
-                encoded, *stats = fields
+        # NOTE The encoded path is the first field, so we can check it
+        # against all our vault prefixes at once, without splitting the
+        # line; this discards the vast majority of records cheaply
+        prefixes, timestamp = self._prefixes, self._timestamp
+        is_match, make_stat, from_stat, vault_status = self._is_match, mpistatWalker._make_stat, File.FromStat, mpistatWalker._vault_status
+
+        # NOTE We work with the raw bytes to avoid decoding every line
+        with gzip.open(self._mpistat, mode="rb") as mpistat:
+            for line in _read_lines(mpistat):
+                if not line.startswith(prefixes):
+                    continue
+
+                # Strip excess whitespace and split the line by tabs
+                encoded, *stats = line.strip().split(b"\t")
 
                 # We only care about regular files that are in the
                 # vaults we are interested in (per the constructor)
-                if stats[_MODE] == "f" and \
-                   (match := self._is_match(encoded)) is not None:
+                if stats[_MODE] == b"f" and \
+                   (match := is_match(encoded)) is not None:
 
                     vault, path = match
                     yield vault, \
-                          File.FromStat(path, mpistatWalker._make_stat(*stats), self._timestamp), \
-                          mpistatWalker._vault_status(vault, path)
+                          from_stat(path, make_stat(*stats), timestamp), \
+                          vault_status(vault, path)
@@ -52,6 +52,62 @@ def _equal_stream_handlers(lhs:logging.StreamHandler, rhs:logging.StreamHandler)
        and lhs.level == rhs.level \
        and lhs.formatter == rhs.formatter
 
+class _LogWrapper:
+    """ End-user logging functions exposed as log.* """
+    _parent:"_LoggableMixin"
+
+    def __init__(self, parent:"_LoggableMixin") -> None:
+        self._parent = parent
+
+    def __call__(self, message:str, level:Level = Level.Info) -> None:
+        """ Log a message at an optional level """
+        self._parent.logger.log(level.value, message)
+
+    # NOTE The following convenience aliases take %-style arguments,
+    # which are only interpolated if the record is actually emitted
+
+    def debug(self, message:str, *args:T.Any) -> None:
+        # Convenience alias
+        self._parent.logger.log(Level.Debug.value, message, *args)
+
+    def info(self, message:str, *args:T.Any) -> None:
+        # Convenience alias
+        self._parent.logger.log(Level.Info.value, message, *args)
+
+    def warning(self, message:str, *args:T.Any) -> None:
+        # Convenience alias
+        self._parent.logger.log(Level.Warning.value, message, *args)
+
+    def error(self, message:str, *args:T.Any) -> None:
+        # Convenience alias
+        self._parent.logger.log(Level.Error.value, message, *args)
+
+    def critical(self, message:str, *args:T.Any) -> None:
+        # Convenience alias
+        self._parent.logger.log(Level.Critical.value, message, *args)
+
+    @property
+    def _streams(self) -> T.Iterator[logging.StreamHandler]:
+        """ Iterator of StreamHandlers on the logger """
+        yield from filter(lambda h: isinstance(h, logging.StreamHandler), self._parent.logger.handlers)
+
+    def _to_stream(self, handler:logging.StreamHandler, formatter:T.Optional[logging.Formatter] = None, level:T.Optional[Level] = None) -> None:
+        """ Add a new stream handler to the logger """
+        parent = self._parent
+        handler.setFormatter(formatter or parent._formatter)
+        handler.setLevel((level or parent._level).value)
+
+        if not any(_equal_stream_handlers(handler, stream) for stream in self._streams):
+            parent.logger.addHandler(handler)
+
+    def to_tty(self, formatter:T.Optional[logging.Formatter] = None, level:T.Optional[Level] = None) -> None:
+        # Convenience alias
+        self._to_stream(logging.StreamHandler(), formatter, level)
+
+    def to_file(self, filename:T.Path, formatter:T.Optional[logging.Formatter] = None, level:T.Optional[Level] = None) -> None:
+        # Convenience alias
+        self._to_stream(logging.FileHandler(filename), formatter, level)
+
 class _LoggableMixin:
     """ Base mixin class for logging interface """
     # NOTE The following can be either class or instance variables
@@ -63,66 +119,29 @@ class _LoggableMixin:
     _level:Level
     _formatter:logging.Formatter
 
+    _log_wrapper:_LogWrapper
+
     @property
     def logger(self) -> logging.Logger:
-        # NOTE setLevel is called explicitly on each invocation to avoid
-        # having downstream classes call it in their constructors
+        # NOTE The level is checked on each invocation to avoid having
+        # downstream classes set it in their constructors; setLevel is
+        # only called when it differs, as it clears the logging cache
         logger = logging.getLogger(self._logger)
-        logger.setLevel(self._level.value)
+        if logger.level != self._level.value:
+            logger.setLevel(self._level.value)
+
         return logger
 
     @property
-    def log(self) -> object:
+    def log(self) -> _LogWrapper:
         """ End-user logging functions exposed as log.* """
-        parent = self
-
-        class _wrapper:
-            def __call__(self, message:str, level:Level = Level.Info) -> None:
-                """ Log a message at an optional level """
-                parent.logger.log(level.value, message)
-
-            def debug(self, message:str) -> None:
-                # Convenience alias
-                self(message, Level.Debug)
-
-            def info(self, message:str) -> None:
-                # Convenience alias
-                self(message, Level.Info)
-
-            def warning(self, message:str) -> None:
-                # Convenience alias
-                self(message, Level.Warning)
-
-            def error(self, message:str) -> None:
-                # Convenience alias
-                self(message, Level.Error)
-
-            def critical(self, message:str) -> None:
-                # Convenience alias
-                self(message, Level.Critical)
-
-            @property
-            def _streams(self) -> T.Iterator[logging.StreamHandler]:
-                """ Iterator of StreamHandlers on the logger """
-                yield from filter(lambda h: isinstance(h, logging.StreamHandler), parent.logger.handlers)
-
-            def _to_stream(self, handler:logging.StreamHandler, formatter:T.Optional[logging.Formatter] = None, level:T.Optional[Level] = None) -> None:
-                """ Add a new stream handler to the logger """
-                handler.setFormatter(formatter or parent._formatter)
-                handler.setLevel((level or parent._level).value)
-
-                if not any(_equal_stream_handlers(handler, stream) for stream in self._streams):
-                    parent.logger.addHandler(handler)
-
-            def to_tty(self, formatter:T.Optional[logging.Formatter] = None, level:T.Optional[Level] = None) -> None:
-                # Convenience alias
-                self._to_stream(logging.StreamHandler(), formatter, level)
-
-            def to_file(self, filename:T.Path, formatter:T.Optional[logging.Formatter] = None, level:T.Optional[Level] = None) -> None:
-                # Convenience alias
-                self._to_stream(logging.FileHandler(filename), formatter, level)
+        try:
+            return self._log_wrapper
 
-        return _wrapper()
+        except AttributeError:
+            # NOTE The wrapper is created once per instance and cached
+            self._log_wrapper = _LogWrapper(self)
+            return self._log_wrapper
 
 
 def _set_exception_handler(loggable:T.Type[_LoggableMixin]) -> None:
@@ -19,10 +19,21 @@ with this program. If not, see https://www.gnu.org/licenses/
 
 from datetime import datetime, timedelta, timezone
 
-now     = lambda: datetime.now(timezone.utc)
-epoch   = lambda ts: datetime.fromtimestamp(ts, timezone.utc)
-to_utc  = lambda dt: dt.astimezone(timezone.utc)
-timestamp = lambda dt: int(to_utc(dt).timestamp())
+# NOTE These are called for every file in the walk, so they are defined
+# as functions over a module-level UTC binding, rather than as lambdas
+_UTC = timezone.utc
+
+def now() -> datetime:
+    return datetime.now(_UTC)
+
+def epoch(ts:float) -> datetime:
+    return datetime.fromtimestamp(ts, _UTC)
+
+def to_utc(dt:datetime) -> datetime:
+    return dt.astimezone(_UTC)
+
+def timestamp(dt:datetime) -> int:
+    return int(dt.astimezone(_UTC).timestamp())
 
 delta   = timedelta
 seconds = lambda d: d.total_seconds()
@@ -18,7 +18,6 @@ with this program. If not, see https://www.gnu.org/licenses/
 """
 
 import os
-from base64 import b64encode, b64decode
 from contextlib import ContextDecorator
 from dataclasses import dataclass
 from math import ceil, log10
@@ -26,6 +25,13 @@ from functools import singledispatch
 
 from . import typing as T
 
+try:
+    # pybase64 is a drop-in replacement for the standard library's
+    # codecs, with SIMD acceleration and native alternative alphabets
+    from pybase64 import b64encode, b64decode
+except ImportError:
+    from base64 import b64encode, b64decode
+
 
 _ALT_CHARS = b"+_"  # instead of "+/"
 
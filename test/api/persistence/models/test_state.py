@@ -0,0 +1,87 @@
+"""
+Copyright (c) 2020 Genome Research Limited
+
+Author: Christopher Harrison <ch12@sanger.ac.uk>
+
+This program is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your
+option) any later version.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General
+Public License for more details.
+
+You should have received a copy of the GNU General Public License along
+with this program. If not, see https://www.gnu.org/licenses/
+"""
+
+import re
+import unittest
+from unittest.mock import MagicMock
+
+from core import persistence, time
+from api.persistence.models.state import State
+
+
+_files = [MagicMock(db_id=1), MagicMock(db_id=2)]
+_stakeholder = MagicMock(uid=123)
+
+# NOTE The mock transaction never returns records, so the states can't
+# be notified on persistence (which would look for them indefinitely)
+_states = [
+    State.Deleted(notified=False),
+    State.Staged(notified=False),
+    State.Warned(notified=False, tminus=time.delta(hours=24))
+]
+
+
+def _transaction() -> MagicMock:
+    # Mock transaction that returns no records
+    t = MagicMock()
+    t.__iter__.side_effect = lambda: iter([])
+    return t
+
+
+class TestPreparedStatements(unittest.TestCase):
+    def setUp(self) -> None:
+        # Exercise every prepared statement for every state
+        self.t = t = _transaction()
+        for state in _states:
+            state.exists(t, _files)
+            state.persist(t, _files)
+            state.mark_notified(t, _files, persistence.Anything)
+            state.mark_notified(t, _files, _stakeholder)
+
+    def test_parameters(self):
+        for name, sql, params in (c.args for c in self.t.execute_prepared.call_args_list):
+            with self.subTest(name=name):
+                positions = {int(n) for n in re.findall(r"\$(\d+)", sql)}
+                self.assertEqual(positions, set(range(1, len(params) + 1)))
+
+    def test_constant_sql(self):
+        # Prepared statement SQL must be the same for any given name
+        statements = {}
+        for name, sql, _ in (c.args for c in self.t.execute_prepared.call_args_list):
+            with self.subTest(name=name):
+                self.assertEqual(statements.setdefault(name, sql), sql)
+
+
+class TestFileCTE(unittest.TestCase):
+    def test_constant_sql(self):
+        for state_type, kwargs in [(State.Staged, {}), (State.Warned, {"tminus": time.delta(hours=24)})]:
+            anything = state_type(notified=persistence.Anything, **{k: persistence.Anything for k in kwargs})
+            specific = state_type(notified=True, **kwargs)
+
+            with self.subTest(state=state_type.__name__):
+                any_sql, any_params = anything.file_cte(persistence.Anything)
+                specific_sql, specific_params = specific.file_cte(_stakeholder)
+
+                self.assertEqual(any_sql, specific_sql)
+                self.assertEqual(any_sql.count("%s"), len(any_params))
+                self.assertEqual(len(any_params), len(specific_params))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Copyright (c) 2019, 2020 Genome Research Limited
+
+Author: Christopher Harrison <ch12@sanger.ac.uk>
+
+This program is free software: you can redistribute it and/or modify it
+under the terms of the GNU General Public License as published by the
+Free Software Foundation, either version 3 of the License, or (at your
+option) any later version.
+
+This program is distributed in the hope that it will be useful, but
+WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU General
+Public License for more details.
+
+You should have received a copy of the GNU General Public License along
+with this program. If not, see https://www.gnu.org/licenses/
+"""
+
+import unittest
+from unittest.mock import MagicMock, call
+
+from api.persistence.postgres import _PreparingCursor
+
+
+class _DummyConnection:
+    """ Weak-referenceable stand-in for a database connection """
+
+
+def _cursor(connection:_DummyConnection) -> MagicMock:
+    # Mock cursor that uses the real execute_prepared implementation
+    cursor = MagicMock(connection=connection)
+    cursor.execute_prepared = lambda *args: _PreparingCursor.execute_prepared(cursor, *args)
+    return cursor
+
+
+class TestPreparingCursor(unittest.TestCase):
+    _sql = "select * from foo where bar = $1 and quux = $2;"
+
+    def test_prepare_once(self):
+        cursor = _cursor(_DummyConnection())
+        cursor.execute_prepared("foo_test", self._sql, (1, 2))
+        cursor.execute_prepared("foo_test", self._sql, (3, 4))
+
+        self.assertEqual(cursor.execute.call_args_list, [
+            call(f"prepare foo_test as {self._sql}"),
+            call("execute foo_test (%s, %s);", (1, 2)),
+            call("execute foo_test (%s, %s);", (3, 4))
+        ])
+
+    def test_prepare_per_connection(self):
+        first = _cursor(_DummyConnection())
+        second = _cursor(_DummyConnection())
+        first.execute_prepared("foo_test", self._sql, (1, 2))
+        second.execute_prepared("foo_test", self._sql, (1, 2))
+
+        for cursor in (first, second):
+            cursor.execute.assert_any_call(f"prepare foo_test as {self._sql}")
+
+    def test_placeholders(self):
+        cursor = _cursor(_DummyConnection())
+        cursor.execute_prepared("foo_single", "select $1;", ([1, 2, 3],))
+        cursor.execute.assert_called_with("execute foo_single (%s);", ([1, 2, 3],))
+
+
+if __name__ == "__main__":
+    unittest.main()
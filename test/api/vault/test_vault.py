@@ -374,6 +374,12 @@ class TestVault(unittest.TestCase):
                 fname.chmod(0o777)
         self.vault.add(Branch.Limbo, self.tmp_file_d)
 
+    def test_branch(self):
+        self.assertIsNone(self.vault.branch(self.tmp_file_a))
+
+        self.vault.add(Branch.Archive, self.tmp_file_a)
+        self.assertEqual(self.vault.branch(self.tmp_file_a), Branch.Archive)
+
     def test_add_incorrect_parent_perms(self):
         # Add child_dir_one/tmp_file_b to vault and check whether hard link exists at desired location.
         self.child_dir_one.chmod(0o577)
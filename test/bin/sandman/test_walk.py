@@ -19,14 +19,17 @@ with this program. If not, see https://www.gnu.org/licenses/
 
 import os
 os.environ["VAULTRC"] = "eg/.vaultrc"
+import gzip
+from concurrent.futures import ThreadPoolExecutor
 from tempfile import TemporaryDirectory
 import unittest
 from unittest import mock
 from unittest.mock import MagicMock
 from api.vault import Branch, Vault
-from core import typing as T, idm as IdM
+from core import typing as T, idm as IdM, time
 from core.vault import exception as VaultExc
-from bin.sandman.walk import FilesystemWalker
+from core.utils import base64
+from bin.sandman.walk import FilesystemWalker, mpistatWalker
 
 
 class _DummyUser(IdM.base.User):
@@ -192,3 +195,125 @@ class TestFileSystemWalker(unittest.TestCase):
         self.assertTrue(isinstance(files[vault_file_two.path], VaultExc.PhysicalVaultFile))
         self.assertFalse(self.file_one in files)
         self.assertFalse(isinstance(files[self.file_two], VaultExc.VaultCorruption))
+
+
+    # Behavior: A walk yields files stat'ed when they're yielded, not when
+    # their directory was scanned
+    @mock.patch('bin.sandman.walk.idm', new = dummy_idm)
+    def test_fresh_stat(self):
+        os.utime(self.file_two, (0, 0))
+        os.utime(self.file_three, (0, 0))
+
+        walker = FilesystemWalker(self.parent)
+
+        mtimes = []
+        for vault, file, status in walker.files():
+            if file.path in (self.file_two, self.file_three):
+                mtimes.append(file.to_persistence().mtime)
+
+                # Touch the other file after its directory has been scanned
+                other = self.file_three if file.path == self.file_two else self.file_two
+                other.touch()
+
+        self.assertEqual(len(mtimes), 2)
+        self.assertEqual(mtimes[0], time.epoch(0))
+        self.assertNotEqual(mtimes[1], time.epoch(0))
+
+
+    # Behavior: A walk of a wide tree only runs a bounded number of
+    # directory scans ahead of the files it has yielded
+    @mock.patch('bin.sandman.walk.idm', new = dummy_idm)
+    @mock.patch('bin.sandman.walk._SCANS_AHEAD', new = 2)
+    def test_bounded_scans(self):
+        wide = [self.parent / f"wide{i}" / "file" for i in range(20)]
+        for f in wide:
+            f.parent.mkdir()
+            f.touch()
+
+        outstanding, peak = set(), 0
+
+        class _TrackingPool(ThreadPoolExecutor):
+            # Track scans that have been submitted but not yet consumed
+            def submit(pool, fn, *args):
+                nonlocal peak
+                scan = super().submit(fn, *args)
+                result = scan.result
+
+                def _consume(*args, **kwargs):
+                    outstanding.discard(scan)
+                    return result(*args, **kwargs)
+
+                scan.result = _consume
+                outstanding.add(scan)
+                peak = max(peak, len(outstanding))
+                return scan
+
+        walker = FilesystemWalker(self.parent)
+        with mock.patch('bin.sandman.walk.ThreadPoolExecutor', new = _TrackingPool):
+            files = {file.path for vault, file, status in walker.files()}
+
+        self.assertTrue(set(wide) <= files)
+        self.assertLessEqual(peak, 2)
+
+
+class TestmpistatWalker(unittest.TestCase):
+
+    def setUp(self):
+        """
+        The following tests will emulate the following directory structure
+            +- parent/
+            |   +- .vault
+            |   +- some/
+            |   |  +- file2
+            |   +- file1
+            +- parent_sibling/
+                +- file3
+        """
+        self._tmp = TemporaryDirectory()
+        self.tmp = T.Path(self._tmp.name).resolve()
+        self.parent = path = self.tmp / "parent"
+        self.some = path / "some"
+        self.some.mkdir(parents=True, exist_ok=True)
+        self.sibling = self.tmp / "parent_sibling"
+        self.sibling.mkdir()
+        self.file_one = path / "file1"
+        self.file_two = self.some / "file2"
+        self.file_three = self.sibling / "file3"
+        for f in self.file_one, self.file_two, self.file_three:
+            f.touch()
+
+        # Monkey patch Vault._find_root so that it returns the directory we want
+        Vault._find_root = MagicMock(return_value = self.parent)
+        self.vault = Vault(relative_to = self.file_one, idm = dummy_idm)
+
+        # mpistat records for everything, in the order: size, owner,
+        # group, atime, mtime, ctime, mode, inode, hardlinks and device
+        self.mpistat = self.tmp / "mpistat.gz"
+        with gzip.open(self.mpistat, mode="wt") as mpistat:
+            for p in self.parent, self.some, self.sibling, self.file_one, self.file_two, self.file_three:
+                stat = p.stat()
+                fields = (stat.st_size, stat.st_uid, stat.st_gid,
+                          int(stat.st_atime), int(stat.st_mtime), int(stat.st_ctime),
+                          "d" if p.is_dir() else "f",
+                          stat.st_ino, stat.st_nlink, stat.st_dev)
+                print(base64.encode(p), *fields, sep="\t", file=mpistat)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+        del self.parent
+
+    # Behavior: A walk yields only the regular files within the vault, with their stat data
+    @mock.patch('bin.sandman.walk.idm', new = dummy_idm)
+    def test_basic_case(self):
+        walker = mpistatWalker(self.mpistat, self.parent)
+
+        files = {}
+        for vault, file, status in walker.files():
+            self.assertEqual(vault, self.vault)
+            files[file.path] = file, status
+
+        self.assertEqual(set(files), {self.file_one, self.file_two})
+
+        file, status = files[self.file_two]
+        self.assertIsNone(status)
+        self.assertEqual(file.to_persistence().inode, self.file_two.stat().st_ino)
@@ -33,6 +33,21 @@ from bin.vault import ViewContext, recover, view
 from bin.common import idm
 
 
+# Vault relative paths, working directories and the expected working
+# directory relative paths for a child and a sibling of the working
+# directory, respectively
+_VAULT_REL_CHILD = T.Path("some/path/file1")
+_WORK_DIR_CHILD  = T.Path("some/path")
+_EXPECTED_CHILD  = T.Path("file1")
+
+_VAULT_REL_SIBLING = T.Path("this/is/my/file3")
+_WORK_DIR_SIBLING  = T.Path("this/is/my/path")
+_EXPECTED_SIBLING  = T.Path("../file3")
+
+_RELATIVISE_CASES = [
+    (_VAULT_REL_CHILD,   _WORK_DIR_CHILD,   _EXPECTED_CHILD),
+    (_VAULT_REL_SIBLING, _WORK_DIR_SIBLING, _EXPECTED_SIBLING)
+]
 
 
 class TestVaultRelativeToWorkDirRelative(unittest.TestCase):
@@ -46,22 +61,17 @@ class TestVaultRelativeToWorkDirRelative(unittest.TestCase):
         +- file3
     """
 
-    def test_child_to_work_dir(self):
-
-        work_dir = T.Path("some/path")
-        vault_relative_path = T.Path("some/path/file1")
-        expected = T.Path("file1")
-        work_dir_rel = relativise(vault_relative_path, work_dir)
-        self.assertEqual(expected, work_dir_rel)
-
-
-    def test_sibling_to_work_dir(self):
-
-        work_dir = T.Path("this/is/my/path")
-        vault_relative_path = T.Path("this/is/my/file3")
-        expected = T.Path("../file3")
-        work_dir_rel = relativise(vault_relative_path, work_dir)
-        self.assertEqual(expected, work_dir_rel)
+    def test_vault_to_work_dir(self):
+        for vault_rel, work_dir, expected in _RELATIVISE_CASES:
+            with self.subTest(vault_rel=vault_rel):
+                self.assertEqual(expected, relativise(vault_rel, work_dir))
+
+    def test_roundtrip(self):
+        vault_root = T.Path("/this/is/vault/root")
+        for vault_rel, work_dir, _ in _RELATIVISE_CASES:
+            with self.subTest(vault_rel=vault_rel):
+                work_dir_rel = relativise(vault_rel, work_dir)
+                self.assertEqual(vault_rel, derelativise(work_dir_rel, work_dir, vault_root))
 
 
 class TestWorkDirRelativeToVaultRelative(unittest.TestCase):
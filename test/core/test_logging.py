@@ -68,6 +68,15 @@ class TestLogger(unittest.TestCase):
         _DummyLogger().log.debug("Hello")
         _mock_logger.log.assert_called_once_with(logging.Level.Debug.value, "Hello")
 
+    def test_lazy_arguments(self):
+        _DummyLogger().log.debug("Hello %s", "World")
+        _mock_logger.log.assert_called_once_with(logging.Level.Debug.value, "Hello %s", "World")
+
+    def test_wrapper_cached(self):
+        logger = _DummyLogger()
+        self.assertIs(logger.log, logger.log)
+        self.assertIsNot(logger.log, _DummyLogger().log)
+
     @patch("sys.exit")
     def test_unhandled_exception(self, mock_exit):
         logging.utils.set_exception_handler(_DummyLogger)